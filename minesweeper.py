@@ -1,5 +1,61 @@
-import itertools
+import bisect
 import random
+import sys
+from collections import defaultdict, deque
+
+import numpy as np
+from scipy.signal import convolve2d
+
+
+def _subset_pair_indices(bits):
+    """
+    Returns the (i, j) index pairs where bits[i] is a strict subset of
+    bits[j]. Equal masks are excluded directly — their difference is
+    empty — rather than by comparing sizes, which also skipped
+    equal-sized pairs that were never subsets anyway. Broadcast-numpy
+    version; replaced by a numba-compiled loop below when numba is
+    installed.
+    """
+    sub = (bits[:, None] & bits[None, :]) == bits[:, None]
+    sub &= bits[:, None] != bits[None, :]
+    return np.argwhere(sub)
+
+
+try:
+    from pysat.card import CardEnc, EncType
+    from pysat.solvers import Glucose4
+except ImportError:
+    Glucose4 = None
+
+try:
+    from numba import njit
+except ImportError:
+    pass
+else:
+    @njit(cache=True)
+    def _subset_pair_indices(bits):
+        pairs = []
+        n = len(bits)
+        for i in range(n):
+            for j in range(n):
+                if bits[i] != bits[j] and (bits[i] & bits[j]) == bits[i]:
+                    pairs.append((i, j))
+        return pairs
+
+
+# The eight neighbor offsets of a cell, i.e. the 3x3 window minus the
+# cell itself
+_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+def _iter_bits(mask):
+    """
+    Yields the individual set bits of a mask, lowest first.
+    """
+    while mask:
+        bit = mask & -mask
+        yield bit
+        mask ^= bit
 
 
 class Minesweeper():
@@ -15,50 +71,52 @@ class Minesweeper():
         self.mines = set()
 
         # Initialize an empty field with no mines
-        self.board = []
-        for i in range(self.height):
-            row = []
-            for j in range(self.width):
-                row.append(False)
-            self.board.append(row)
+        self.board = np.zeros((self.height, self.width), dtype=bool)
 
         mine_locations = [(2, 3), (4, 3), (5, 5), (6, 1), (6, 3), (6, 4), (6, 6), (7, 0), (0,0)]
         small_locations = [
             (0, 1), (0, 2), (0, 3), (2, 2), (1, 3), (3, 2)
         ]
-        # Add mines randomly
-        while len(self.mines) != mines:
-            i = random.randrange(height)
-            j = random.randrange(width)
-            # i, j = mine_locations[len(self.mines)]
-            if not self.board[i][j]:
-                self.mines.add((i, j))
-                self.board[i][j] = True
-        with open("mines.txt", "w+") as f:
-            for i, j in self.mines:
-                f.write(f"{i} {j}\n")
+        # Add mines randomly: sample distinct flat positions in one shot
+        # instead of retrying on collisions
+        positions = random.sample(range(self.height * self.width), mines)
+        self.mines = {(p // self.width, p % self.width) for p in positions}
+        self.board.flat[positions] = True
+
+        # Precompute every cell's neighboring-mine count in one
+        # vectorized pass: 3x3 convolution, minus the cell itself
+        self._nearby = (
+            convolve2d(self.board, np.ones((3, 3)), mode="same") - self.board
+        ).astype(np.int8)
 
         # At first, player has found no mines
         self.mines_found = set()
 
+    def dump_mines(self, path="mines.txt"):
+        """
+        Writes the mine locations to a file, one "i j" pair per line.
+        """
+        with open(path, "w+") as f:
+            for i, j in self.mines:
+                f.write(f"{i} {j}\n")
+
     def print(self):
         """
         Prints a text-based representation
         of where mines are located.
         """
+        divider = "--" * self.width + "-"
+        lines = [divider]
         for i in range(self.height):
-            print("--" * self.width + "-")
-            for j in range(self.width):
-                if self.board[i][j]:
-                    print("|X", end="")
-                else:
-                    print("| ", end="")
-            print("|")
-        print("--" * self.width + "-")
+            lines.append("".join(
+                "|X" if self.board[i, j] else "| "
+                for j in range(self.width)
+            ) + "|")
+            lines.append(divider)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def is_mine(self, cell):
-        i, j = cell
-        return self.board[i][j]
+        return bool(self.board[cell])
 
     def nearby_mines(self, cell):
         """
@@ -66,23 +124,7 @@ class Minesweeper():
         within one row and column of a given cell,
         not including the cell itself.
         """
-
-        # Keep count of nearby mines
-        count = 0
-
-        # Loop over all cells within one row and column
-        for i in range(cell[0] - 1, cell[0] + 2):
-            for j in range(cell[1] - 1, cell[1] + 2):
-
-                # Ignore the cell itself
-                if (i, j) == cell: continue
-
-                # Update count if cell in bounds and is mine
-                if 0 <= i < self.height and 0 <= j < self.width:
-                    if (i, j) in self.mines:
-                        count += 1
-
-        return count
+        return int(self._nearby[cell])
 
     def won(self):
         """
@@ -94,164 +136,400 @@ class Minesweeper():
 class Sentence():
     """
     Logical statement about a Minesweeper game
-    A sentence consists of a set of board cells,
-    and a count of the number of those cells which are mines.
+    A sentence consists of a bitmask of board cells (bit i*width+j set
+    for cell (i, j)), and a count of the number of those cells which
+    are mines. Every set operation the AI needs — membership, subset,
+    difference, size — is a single machine-word op on the mask.
     """
 
-    def __init__(self, cells, count):
-        self.cells = set(cells)
+    def __init__(self, cells_mask, count):
+        self.cells_mask = cells_mask
         self.count = count
 
     def __eq__(self, other):
-        return self.cells == other.cells and self.count == other.count
+        return self.cells_mask == other.cells_mask and self.count == other.count
+
+    def __hash__(self):
+        # Hash tracks the current (mask, count) state; the AI removes a
+        # sentence from its lookup set before mutating and re-adds after
+        return hash((self.cells_mask, self.count))
 
     def __str__(self):
-        return f"{self.cells} = {self.count}"
+        return f"{bin(self.cells_mask)} = {self.count}"
 
     def known_mines(self):
         """
-        Returns the set of all cells in self.cells known to be mines.
+        Returns the mask of all cells in the sentence known to be mines.
         """
-        if len(self.cells) == self.count:
-            return self.cells
-        return set()
+        if self.cells_mask.bit_count() == self.count:
+            return self.cells_mask
+        return 0
 
     def known_safes(self):
         """
-        Returns the set of all cells in self.cells known to be safe.
+        Returns the mask of all cells in the sentence known to be safe.
         """
         if self.count == 0:
-            return self.cells
-        return set()
+            return self.cells_mask
+        return 0
 
-    def mark_mine(self, cell):
+    def mark_mine(self, bit):
         """
         Updates internal knowledge representation given the fact that
-        a cell is known to be a mine.
+        the cell with this bit is known to be a mine.
         """
-        if cell in self.cells:
-            self.cells.remove(cell)
+        if self.cells_mask & bit:
+            self.cells_mask ^= bit
             self.count -= 1
 
-    def mark_safe(self, cell):
+    def mark_safe(self, bit):
         """
         Updates internal knowledge representation given the fact that
-        a cell is known to be safe.
+        the cell with this bit is known to be safe.
         """
-        if cell in self.cells:
-            self.cells.remove(cell)
-        
+        if self.cells_mask & bit:
+            self.cells_mask ^= bit
+
 
 class MinesweeperAI():
     """
     Minesweeper game player
     """
 
-    def __init__(self, height=8, width=8):
+    def __init__(self, height=8, width=8, verbose=False):
 
         # Set initial height and width
         self.height = height
         self.width = width
 
+        # Print the knowledge-base dump after every move only when asked
+        # to; the stdout I/O otherwise dominates batch runs
+        self.verbose = verbose
+
         # Keep track of which cells have been clicked on
         self.moves_made = set()
 
-        # Keep track of cells known to be safe or mines
+        # Cells still playable (not yet clicked, not known mines) and
+        # known-safe cells not yet played, maintained incrementally so
+        # move selection never has to rescan the board
+        self._available = {
+            (i, j) for i in range(height) for j in range(width)
+        }
+        self._untried_safes = set()
+
+        # Keep track of cells known to be safe or mines, both as sets of
+        # (i, j) tuples (the outside-facing view) and as bitmasks (what
+        # the inference code works with)
         self.mines = set()
         self.safes = set()
-
-        # List of sentences about the game known to be true
+        self.mines_mask = 0
+        self.safes_mask = 0
+
+        # Sorted views of the sets above, kept in order with insort as
+        # cells arrive so print_info doesn't re-sort every move
+        self._moves_sorted = []
+        self._mines_sorted = []
+        self._safes_sorted = []
+
+        # List of sentences about the game known to be true, plus a
+        # parallel set so "have we seen this sentence" is O(1) instead
+        # of a linear scan through self.knowledge
         self.knowledge = []
+        self._knowledge_set = set()
+
+        # Worklist of sentences whose state changed and that may now be
+        # trivially solved; drained to a fixpoint by _drain_dirty
+        self._dirty = deque()
+
+        # Every cells_mask ever added to the knowledge base. A mask that
+        # shows up again carries no new information (its sentence was
+        # already exploited), so derivation skips it without even
+        # building the Sentence
+        self._seen_masks = set()
+
+        # Inverted index: mask bit -> sentences containing that cell, so
+        # mark_mine/mark_safe visit only the sentences that matter.
+        # Entries go stale when a sentence drops the cell elsewhere;
+        # readers skip those with a cells_mask & bit check.
+        self._cell_index = {}
+
+        # Precompute every cell's neighbors once, both as a tuple of
+        # cells and as a mask, so the per-move lookups are O(1)
+        self._neighbors = {}
+        self._neighbor_mask = {}
+        for i in range(self.height):
+            for j in range(self.width):
+                neighbors = []
+                mask = 0
+                for di, dj in _OFFSETS:
+                    ni, nj = i + di, j + dj
+                    if 0 <= ni < self.height and 0 <= nj < self.width:
+                        neighbors.append((ni, nj))
+                        mask |= 1 << (ni * self.width + nj)
+                self._neighbors[(i, j)] = tuple(neighbors)
+                self._neighbor_mask[(i, j)] = mask
+
+    def _cell_bit(self, cell):
+        """
+        Returns the mask bit for a cell.
+        """
+        return 1 << (cell[0] * self.width + cell[1])
+
+    def _bit_cell(self, bit):
+        """
+        Returns the (i, j) cell for a single mask bit.
+        """
+        return divmod(bit.bit_length() - 1, self.width)
+
+    def _cells_bits(self, cells):
+        """
+        Returns the combined mask for a collection of cells.
+        """
+        bits = 0
+        for cell in cells:
+            bits |= self._cell_bit(cell)
+        return bits
+
+    def _mask_cells(self, mask):
+        """
+        Yields the (i, j) cells of a mask.
+        """
+        for bit in _iter_bits(mask):
+            yield self._bit_cell(bit)
+
+    def _index_sentence(self, sentence):
+        """
+        Adds a sentence to the cell index under each of its cells.
+        """
+        for bit in _iter_bits(sentence.cells_mask):
+            self._cell_index.setdefault(bit, []).append(sentence)
 
     def mark_mine(self, cell):
         """
         Marks a cell as a mine, and updates all knowledge
         to mark that cell as a mine as well.
         """
+        if cell in self.mines:
+            return
         self.mines.add(cell)
-        for sentence in self.knowledge:
-            sentence.mark_mine(cell)
-            if len(sentence.cells) == 0:
-                self.knowledge.remove(sentence)
+        bisect.insort(self._mines_sorted, cell)
+        self._available.discard(cell)
+        self._untried_safes.discard(cell)
+        bit = self._cell_bit(cell)
+        self.mines_mask |= bit
+        # No sentence can ever gain a known cell again, so the whole
+        # index entry is consumed here
+        for sentence in self._cell_index.pop(bit, ()):
+            if sentence.cells_mask & bit:
+                # hash depends on (mask, count): remove, mutate, re-add
+                self._knowledge_set.discard(sentence)
+                sentence.mark_mine(bit)
+                if sentence.cells_mask:
+                    self._knowledge_set.add(sentence)
+                    self._dirty.append(sentence)
 
     def mark_all_mines(self, sentence):
-        for cell in sentence.cells.copy():
-            self.mark_mine(cell)
-        
+        # _iter_bits walks a snapshot of the mask, so mutating the
+        # sentence while marking is fine
+        for bit in _iter_bits(sentence.cells_mask):
+            self.mark_mine(self._bit_cell(bit))
+
     def mark_all_safe(self, sentence):
-        for cell in sentence.cells.copy():
-            self.mark_safe(cell)
+        for bit in _iter_bits(sentence.cells_mask):
+            self.mark_safe(self._bit_cell(bit))
 
     def mark_safe(self, cell):
         """
         Marks a cell as safe, and updates all knowledge
         to mark that cell as safe as well.
         """
+        if cell in self.safes:
+            return
         self.safes.add(cell)
-        for sentence in self.knowledge:
-            sentence.mark_safe(cell)
-            if len(sentence.cells) == 0:
-                self.knowledge.remove(sentence)
+        bisect.insort(self._safes_sorted, cell)
+        if cell not in self.moves_made:
+            self._untried_safes.add(cell)
+        bit = self._cell_bit(cell)
+        self.safes_mask |= bit
+        for sentence in self._cell_index.pop(bit, ()):
+            if sentence.cells_mask & bit:
+                self._knowledge_set.discard(sentence)
+                sentence.mark_safe(bit)
+                if sentence.cells_mask:
+                    self._knowledge_set.add(sentence)
+                    self._dirty.append(sentence)
 
     def get_neighbors(self, cell):
         """
-        Returns the list of neighbors of a cell.
+        Returns the neighbors of a cell.
         """
-        neighbors = []
-        for i in range(cell[0] - 1, cell[0] + 2):
-            for j in range(cell[1] - 1, cell[1] + 2):
-                if 0 <= i < self.height and 0 <= j < self.width and (i, j) != cell:
-                    neighbors.append((i, j))
-        return neighbors
-    
+        return self._neighbors[cell]
+
     def mines_in_neighbors(self, cell):
-        count = 0
-        for neighbor in self.get_neighbors(cell):
-            if neighbor in self.mines:
-                count += 1
-        return count
-    
+        return (self._neighbor_mask[cell] & self.mines_mask).bit_count()
+
     def unknown_neighbors(self, cell):
-        nieghbors = self.get_neighbors(cell)
-        for neighbor in nieghbors:
-            if neighbor in self.mines or neighbor in self.safes:
-                nieghbors.remove(neighbor)
-        return nieghbors
+        """
+        Returns the mask of neighbors not yet known to be safe or mines.
+        """
+        return self._neighbor_mask[cell] & ~(self.mines_mask | self.safes_mask)
 
     def add_knowledge(self, cell, count):
-        self.moves_made.add(cell)
+        if cell not in self.moves_made:
+            self.moves_made.add(cell)
+            bisect.insort(self._moves_sorted, cell)
+        self._available.discard(cell)
+        self._untried_safes.discard(cell)
         self.mark_safe(cell)
-        unknown_nieghbors = self.unknown_neighbors(cell)
+        unknown_mask = self.unknown_neighbors(cell)
         known_mines_around = self.mines_in_neighbors(cell)
-        self.knowledge.append(Sentence(unknown_nieghbors, count - known_mines_around))
+        new_sentence = Sentence(unknown_mask, count - known_mines_around)
+        # Invalid sentences are dropped at the door instead of being
+        # filtered out of the list afterwards
+        if (new_sentence.cells_mask and new_sentence.count >= 0
+                and new_sentence not in self._knowledge_set):
+            self.knowledge.append(new_sentence)
+            self._knowledge_set.add(new_sentence)
+            self._seen_masks.add(new_sentence.cells_mask)
+            self._index_sentence(new_sentence)
+            # Only the new sentence and whatever marking touches can
+            # have become trivially solved; drain those to a fixpoint
+            # instead of rescanning the whole knowledge base
+            self._dirty.append(new_sentence)
+        self._drain_dirty()
+        self.knowledge = [s for s in self.knowledge if s.cells_mask]
+        self._infer_subsets()
+        self._drain_dirty()
+        self.knowledge = [s for s in self.knowledge if s.cells_mask]
+        # Subset subtraction is incomplete; before falling back to a
+        # random guess, let the SAT solver squeeze out anything left
+        if not self._untried_safes:
+            self._sat_inference()
+
+        if __debug__ and self.verbose:
+            self.print_info()
+
+    def _infer_subsets(self):
+        """
+        Derives new sentences from subset pairs: if A's cells are a
+        subset of B's, then B - A holds B.count - A.count mines. Each
+        pair is found once with the smaller sentence first, which
+        covers both directions of the old two-branch comparison.
+        """
+        if len(self.knowledge) < 2:
+            return
+        if self.height * self.width <= 64:
+            pairs = self._subset_pairs_numpy()
+        else:
+            pairs = self._subset_pairs_bucketed()
+        for small, big in pairs:
+            new_bits = big.cells_mask & ~small.cells_mask
+            if new_bits in self._seen_masks:
+                continue
+            self._seen_masks.add(new_bits)
+            new_sentence = Sentence(new_bits, big.count - small.count)
+            self.knowledge.append(new_sentence)
+            self._knowledge_set.add(new_sentence)
+            self._index_sentence(new_sentence)
+            self._dirty.append(new_sentence)
+
+    def _subset_pairs_numpy(self):
+        """
+        Finds all (small, big) strict-subset sentence pairs in one
+        compiled pass: masks fit in uint64, so the pairwise subset test
+        is integer bit-ops all the way down — a numba loop when
+        available, broadcast numpy otherwise.
+        """
+        sentences = self.knowledge
+        bits = np.fromiter(
+            (s.cells_mask for s in sentences),
+            dtype=np.uint64, count=len(sentences)
+        )
+        return [
+            (sentences[i], sentences[j])
+            for i, j in _subset_pair_indices(bits)
+        ]
+
+    def _subset_pairs_bucketed(self):
+        """
+        Pure-Python fallback for boards whose masks overflow uint64:
+        bucket sentences by size and compare each against the strictly
+        larger buckets. Skipping equal-sized pairs loses nothing —
+        equal-sized sets are only subsets when equal, and equal masks
+        subtract to the empty sentence.
+        """
+        buckets = defaultdict(list)
+        for sentence in self.knowledge:
+            buckets[sentence.cells_mask.bit_count()].append(sentence)
+        sizes = sorted(buckets)
+        pairs = []
+        for index, size1 in enumerate(sizes):
+            for size2 in sizes[index + 1:]:
+                for sentence1 in buckets[size1]:
+                    for sentence2 in buckets[size2]:
+                        if (sentence1.cells_mask & sentence2.cells_mask) == sentence1.cells_mask:
+                            pairs.append((sentence1, sentence2))
+        return pairs
+
+    def _sat_inference(self):
+        """
+        Complete inference over the frontier via SAT. Each sentence
+        becomes an exactly-count cardinality constraint over one
+        Boolean variable per cell (variable = bit index + 1); a frontier
+        cell that can't be a mine in any model is safe, and one that
+        must be a mine in every model is a mine. This catches
+        deductions subset subtraction misses, like 1-2-1 patterns and
+        count parity along a border. No-op when pysat isn't installed.
+        """
+        if Glucose4 is None or not self.knowledge:
+            return
+        frontier_mask = 0
+        for sentence in self.knowledge:
+            frontier_mask |= sentence.cells_mask
+        top = self.height * self.width
+        clauses = []
         for sentence in self.knowledge:
-            if len(sentence.cells) == 0 or sentence.count < 0: #Invalid sentence
-                self.knowledge.remove(sentence)
-            elif sentence.count == 0:
+            lits = [bit.bit_length() for bit in _iter_bits(sentence.cells_mask)]
+            enc = CardEnc.equals(
+                lits=lits, bound=sentence.count,
+                top_id=top, encoding=EncType.seqcounter
+            )
+            top = max(top, enc.nv)
+            clauses.extend(enc.clauses)
+        safe_cells = []
+        mine_cells = []
+        with Glucose4(bootstrap_with=clauses) as solver:
+            for bit in _iter_bits(frontier_mask):
+                var = bit.bit_length()
+                if not solver.solve(assumptions=[var]):
+                    safe_cells.append(self._bit_cell(bit))
+                elif not solver.solve(assumptions=[-var]):
+                    mine_cells.append(self._bit_cell(bit))
+        for cell in safe_cells:
+            self.mark_safe(cell)
+        for cell in mine_cells:
+            self.mark_mine(cell)
+        if safe_cells or mine_cells:
+            self._drain_dirty()
+            self.knowledge = [s for s in self.knowledge if s.cells_mask]
+
+    def _drain_dirty(self):
+        """
+        Pops changed sentences until the worklist is empty, marking the
+        cells of any that became trivially solved (no mines left, or as
+        many mines as cells). Marking pushes the sentences it touches,
+        so cascades propagate immediately instead of waiting for the
+        next move's add_knowledge.
+        """
+        while self._dirty:
+            sentence = self._dirty.popleft()
+            mask = sentence.cells_mask
+            if not mask:
+                continue
+            if sentence.count == 0:
                 self.mark_all_safe(sentence)
-            elif sentence.count == len(sentence.cells):
+            elif sentence.count == mask.bit_count():
                 self.mark_all_mines(sentence)
-        for sentence1, sentence2 in itertools.combinations(self.knowledge, 2):
-            if len(sentence1.cells) == len(sentence2.cells): continue
-
-            if sentence1.cells.issubset(sentence2.cells):
-                new_sentence = Sentence(
-                    sentence2.cells - sentence1.cells, 
-                    sentence2.count - sentence1.count
-                )
-                if new_sentence not in self.knowledge:
-                    if new_sentence.count == 0: self.mark_all_safe(new_sentence)
-                    else: self.knowledge.append(new_sentence)
-            elif sentence2.cells.issubset(sentence1.cells):
-                new_sentence = Sentence(
-                    sentence1.cells - sentence2.cells, 
-                    sentence1.count - sentence2.count
-                )
-                if new_sentence not in self.knowledge:
-                    if new_sentence.count == 0: self.mark_all_safe(new_sentence)
-                    else: self.knowledge.append(new_sentence)
-        
-        self.print_info()
 
 
     def print_info(self):
@@ -259,12 +537,14 @@ class MinesweeperAI():
         if len(self.knowledge) > 0:
             print("Knowledge base:")
             for fact in self.knowledge:
-                print(f"  {len(fact.cells)} Cells with {fact.count} Mine{"s:" if fact.count > 1 else ":"}\t{fact.cells}")
+                cells = set(self._mask_cells(fact.cells_mask))
+                print(f"  {len(cells)} Cells with {fact.count} Mine{'s:' if fact.count > 1 else ':'}\t{cells}")
         else: print("Knowledge base: Empty")
 
-        print(f"Played cells ({len(self.moves_made)}): \n  [{", ".join([str(cell) for cell in sorted(self.moves_made)]) if len(self.moves_made) > 0 else "EMPTY"}]")
-        print(f"Additional Safe cells ({len(self.safes - self.moves_made)}): \n  [{", ".join([str(cell) for cell in sorted(self.safes - self.moves_made)]) if len(self.safes) > 0 else "EMPTY"}]")
-        print(f"Mine cells ({len(self.mines)}): \n  [{", ".join([str(cell) for cell in sorted(self.mines)]) if len(self.mines) > 0 else "EMPTY"}]")
+        untried = [cell for cell in self._safes_sorted if cell not in self.moves_made]
+        print(f"Played cells ({len(self._moves_sorted)}): \n  [{', '.join([str(cell) for cell in self._moves_sorted]) if len(self._moves_sorted) > 0 else 'EMPTY'}]")
+        print(f"Additional Safe cells ({len(untried)}): \n  [{', '.join([str(cell) for cell in untried]) if len(self.safes) > 0 else 'EMPTY'}]")
+        print(f"Mine cells ({len(self._mines_sorted)}): \n  [{', '.join([str(cell) for cell in self._mines_sorted]) if len(self._mines_sorted) > 0 else 'EMPTY'}]")
         print("******************")
 
     def make_safe_move(self):
@@ -277,9 +557,8 @@ class MinesweeperAI():
         and self.moves_made, but should not modify any of those values.
         """
 
-        for cell in self.safes:
-            if cell not in self.moves_made and cell not in self.mines:
-                return cell
+        if self._untried_safes:
+            return next(iter(self._untried_safes))
 
         return None
     
@@ -292,12 +571,9 @@ class MinesweeperAI():
             2) are not known to be mines
         """
 
-        for _ in range(self.height * self.width * 10):
-            random_move = (random.randint(0, self.height - 1), random.randint(0, self.width - 1))
-            if random_move not in self.moves_made and random_move not in self.mines:
-                return random_move
-            
-        
+        if self._available:
+            return random.choice(list(self._available))
+
         return None
     
 